@@ -25,10 +25,12 @@ def acquire_cross_platform_stdout():
     # As per #254: stdout need to be wrapped so that windows get a correct csv
     # stream output
     if "windows" in platform.system().lower():
+        # NOTE: like python does for its own stdout, we only line buffer when
+        # writing to a terminal, so that piped output is block buffered
         return open(
             sys.__stdout__.fileno(),
             mode=sys.__stdout__.mode,
-            buffering=1,
+            buffering=1 if sys.__stdout__.isatty() else -1,
             encoding=sys.__stdout__.encoding,
             errors=sys.__stdout__.errors,
             newline="",
@@ -761,7 +763,7 @@ def build_commands():
 CASANOVA_PARSER, CASANOVA_COMMANDS = build_commands()
 
 
-def run(arguments_override: Optional[str] = None):
+def run(arguments_override: Optional[str] = None, output_file=None):
     cli_args = CASANOVA_PARSER.parse_args(
         shlex.split(arguments_override) if arguments_override is not None else None
     )
@@ -784,8 +786,17 @@ def run(arguments_override: Optional[str] = None):
         cli_args.file = sys.stdin
 
     # Dealing with output stream
-    if cli_args.output is None or cli_args.output == "-":
-        action(cli_args, acquire_cross_platform_stdout())
+    if output_file is not None:
+        action(cli_args, output_file)
+    elif cli_args.output is None or cli_args.output == "-":
+        stdout = acquire_cross_platform_stdout()
+
+        # NOTE: stdout may be block buffered, so we make sure rows already
+        # produced are written even if the action fails
+        try:
+            action(cli_args, stdout)
+        finally:
+            stdout.flush()
     else:
         with ensure_open(
             cli_args.output, "w", encoding="utf-8", newline=""
@@ -2,6 +2,7 @@ from typing import Optional, List
 
 import re
 import sys
+import ast
 import gzip
 import json
 import math
@@ -9,11 +10,12 @@ import random
 import statistics
 from threading import Lock
 from types import GeneratorType
+from operator import itemgetter
 from os.path import join
 from urllib.parse import urlsplit, urljoin
 from multiprocessing import Pool as MultiProcessPool
 from dataclasses import dataclass
-from collections import Counter, defaultdict, deque, OrderedDict
+from collections import Counter, defaultdict, deque
 from collections.abc import Mapping, Iterable
 
 from casanova import (
@@ -109,6 +111,7 @@ CODE = None
 FUNCTION = None
 ARGS = None
 SELECTION = None
+SELECTION_GETTER = None
 BEFORE_CODES = []
 AFTER_CODES = []
 EVALUATION_CONTEXT = {}
@@ -168,6 +171,14 @@ def initialize_evaluation_context():
     }
 
 
+def compile_codes(options: InitializerOptions):
+    code = compile(options.code, "<code>", "eval")
+    before_codes = [compile(c, "<before>", "exec") for c in options.before_codes]
+    after_codes = [compile(c, "<after>", "exec") for c in options.after_codes]
+
+    return code, before_codes, after_codes
+
+
 def multiprocessed_initializer(options: InitializerOptions):
     global CODE
     global FUNCTION
@@ -176,6 +187,7 @@ def multiprocessed_initializer(options: InitializerOptions):
     global AFTER_CODES
     global ROW
     global SELECTION
+    global SELECTION_GETTER
     global BASE_DIR
 
     # Reset in case of multiple execution from same process
@@ -183,6 +195,7 @@ def multiprocessed_initializer(options: InitializerOptions):
     FUNCTION = None
     ARGS = None
     SELECTION = None
+    SELECTION_GETTER = None
     BEFORE_CODES = []
     AFTER_CODES = []
     ROW = None
@@ -193,13 +206,18 @@ def multiprocessed_initializer(options: InitializerOptions):
         FUNCTION = import_target(options.code)
         ARGS = options.args
     else:
-        CODE = options.code
-        BEFORE_CODES = options.before_codes
-        AFTER_CODES = options.after_codes
+        CODE, BEFORE_CODES, AFTER_CODES = compile_codes(options)
 
     if options.selected_indices is not None:
         SELECTION = options.selected_indices
 
+        # NOTE: itemgetter returns the bare item when given a single index
+        if len(SELECTION) == 1:
+            index = SELECTION[0]
+            SELECTION_GETTER = lambda row: (row[index],)
+        else:
+            SELECTION_GETTER = itemgetter(*SELECTION)
+
     if options.fieldnames is not None:
         EVALUATION_CONTEXT["fieldnames"] = options.fieldnames
         EVALUATION_CONTEXT["headers"] = Headers(options.fieldnames)
@@ -218,7 +236,7 @@ def select(row):
     if SELECTION is None:
         return
 
-    cells = tuple(row[i] for i in SELECTION)
+    cells = SELECTION_GETTER(row)
     EVALUATION_CONTEXT["cells"] = cells
     EVALUATION_CONTEXT["cell"] = cells[0]
 
@@ -318,6 +336,12 @@ def mp_iteration(cli_args, reader: Reader):
         base_dir=cli_args.base_dir,
     )
 
+    # NOTE: user code is compiled once per process by the initializer, but we
+    # compile it here first so that syntax errors are reported right away
+    # instead of crashing pool workers.
+    if not cli_args.module:
+        compile_codes(init_options)
+
     with get_pool(cli_args.processes, init_options) as pool:
         # NOTE: we keep track of rows being worked on from the main process
         # to avoid serializing them back with worker result.
@@ -349,8 +373,26 @@ def mp_iteration(cli_args, reader: Reader):
             yield i, row, result
 
 
+NOT_A_LITERAL = object()
+
+
+def get_literal_value(cli_args):
+    """
+    Returns the value of the code given to the CLI if it is a mere python
+    literal that does not need to be evaluated for each row, or
+    NOT_A_LITERAL if this is not the case.
+    """
+    if cli_args.module or cli_args.init or cli_args.before or cli_args.after:
+        return NOT_A_LITERAL
+
+    try:
+        return ast.literal_eval(cli_args.code)
+    except (ValueError, TypeError, SyntaxError):
+        return NOT_A_LITERAL
+
+
 def map_action(cli_args, output_file):
-    serialize = get_csv_serializer(cli_args)
+    serialize = get_csv_serializer(cli_args).specialize()
 
     with Enricher(
         cli_args.file,
@@ -358,12 +400,23 @@ def map_action(cli_args, output_file):
         add=[cli_args.new_column],
         delimiter=cli_args.delimiter,
     ) as enricher:
-        for _, row, result in mp_iteration(cli_args, enricher):
-            enricher.writerow(row, [serialize(result)])
+        literal_value = get_literal_value(cli_args)
+
+        # NOTE: if the code is a literal, we don't need to evaluate it per row
+        if literal_value is not NOT_A_LITERAL:
+            addendum = [serialize(literal_value)]
+
+            enricher.writerows((row, addendum) for row in enricher)
+            return
+
+        enricher.writerows(
+            (row, [serialize(result)])
+            for _, row, result in mp_iteration(cli_args, enricher)
+        )
 
 
 def flatmap_action(cli_args, output_file):
-    serialize = get_csv_serializer(cli_args)
+    serialize = get_csv_serializer(cli_args).specialize()
 
     select = None
     add = [cli_args.new_column]
@@ -391,23 +444,30 @@ def flatmap_action(cli_args, output_file):
         else:
             enricher.writeheader()
 
-        for _, row, result in mp_iteration(cli_args, enricher):
-            for value in flatmap(result):
-                if cli_args.replace is None:
-                    enricher.writerow(row, [serialize(value)])
-                else:
-                    row[replaced_column_idx] = serialize(value)
-                    enricher.writerow(row)
+        def items():
+            for _, row, result in mp_iteration(cli_args, enricher):
+                for value in flatmap(result):
+                    if cli_args.replace is None:
+                        yield row, [serialize(value)]
+                    else:
+                        # NOTE: copying since the same row may be emitted
+                        # multiple times with a different replaced cell
+                        replaced_row = row.copy()
+                        replaced_row[replaced_column_idx] = serialize(value)
+                        yield (replaced_row,)
+
+        enricher.writerows(items())
 
 
 def filter_action(cli_args, output_file):
     with Enricher(cli_args.file, output_file, delimiter=cli_args.delimiter) as enricher:
-        for _, row, result in mp_iteration(cli_args, enricher):
-            if cli_args.invert_match:
-                result = not result
+        invert_match = cli_args.invert_match
 
-            if result:
-                enricher.writerow(row)
+        enricher.writerows(
+            (row,)
+            for _, row, result in mp_iteration(cli_args, enricher)
+            if bool(result) is not invert_match
+        )
 
 
 def map_reduce_action(cli_args, output_file):
@@ -431,6 +491,11 @@ def map_reduce_action(cli_args, output_file):
 
         acc_context["acc"] = acc
 
+        acc_code = None
+
+        if acc_fn is None:
+            acc_code = compile(cli_args.accumulator, "<accumulator>", "eval")
+
         for _, row, result in mp_iteration(cli_args, enricher):
             if not initialized:
                 acc_context["acc"] = result
@@ -439,7 +504,7 @@ def map_reduce_action(cli_args, output_file):
 
             if acc_fn is None:
                 acc_context["current"] = result
-                acc_context["acc"] = eval(cli_args.accumulator, acc_context, None)
+                acc_context["acc"] = eval(acc_code, acc_context, None)
             else:
                 acc_context["acc"] = acc_fn(acc_context["acc"], result)
 
@@ -493,8 +558,9 @@ def groupby_action(cli_args, output_file):
         cli_args.file,
         delimiter=cli_args.delimiter,
     ) as enricher:
-        # NOTE: using an ordered dict to guarantee stability for all python versions
-        groups = OrderedDict()
+        # NOTE: dicts keep insertion order on every supported python version,
+        # so groups are emitted in order of first appearance
+        groups = {}
 
         # Grouping
         for _, row, result in mp_iteration(cli_args, enricher):
@@ -523,6 +589,11 @@ def groupby_action(cli_args, output_file):
 
         group_wrapper = GroupWrapper(enricher.fieldnames)
 
+        agg_code = None
+
+        if agg_fn is None:
+            agg_code = compile(cli_args.aggregator, "<aggregator>", "eval")
+
         for name, rows in groups.items():
             group_wrapper._replace(name, rows)
 
@@ -530,7 +601,7 @@ def groupby_action(cli_args, output_file):
                 result = agg_fn(group_wrapper)
             else:
                 agg_context["group"] = group_wrapper
-                result = eval(cli_args.aggregator, agg_context, None)
+                result = eval(agg_code, agg_context, None)
 
             name = serializer(name)
 
@@ -5,9 +5,10 @@
 # A CSV reader/writer combo that can be used to read an input CSV file and
 # easily ouput a similar CSV file while editing, adding and filtering cell_count.
 #
-from typing import Optional, Iterable, Union
+from typing import Optional, Iterable, Union, List, Callable, Tuple
 from casanova.types import AnyWritableCSVRowPart, AnyCSVDialect
 
+from operator import itemgetter
 from ebbe import with_is_last
 
 from casanova.resumers import (
@@ -25,6 +26,19 @@ from casanova.defaults import DEFAULTS
 from casanova.serialization import CustomTypes
 
 
+def build_cells_selector(indices: List[int]) -> Callable[[List], List]:
+    if not indices:
+        return lambda row: []
+
+    # NOTE: itemgetter returns the bare item when given a single index
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: [row[index]]
+
+    getter = itemgetter(*indices)
+    return lambda row: list(getter(row))
+
+
 class Enricher(Reader):
     __supported_resumers__ = (RowCountResumer, LastCellComparisonResumer)
 
@@ -42,6 +56,8 @@ class Enricher(Reader):
         writer_escapechar: Optional[str] = None,
         writer_quoting: Optional[int] = None,
         writer_lineterminator: Optional[str] = None,
+        writer_batch_size: Optional[int] = None,
+        writer_buffer_size: Optional[int] = None,
         write_header: bool = True,
         **kwargs
     ):
@@ -57,6 +73,7 @@ class Enricher(Reader):
         self.strip_null_bytes_on_write = strip_null_bytes_on_write
 
         self.selected_indices = None
+        self.__select_cells = None
         self.output_fieldnames = (
             list(self.fieldnames) if self.fieldnames is not None else None
         )
@@ -67,6 +84,10 @@ class Enricher(Reader):
                 self.selected_indices = Headers.select_no_headers(self.row_len, select)
             else:
                 self.selected_indices = self.headers.select(select)
+
+            self.__select_cells = build_cells_selector(self.selected_indices)
+
+            if not no_headers:
                 self.output_fieldnames = self.__filterrow(self.output_fieldnames)
 
         add = coerce_fieldnames(add)
@@ -135,10 +156,26 @@ class Enricher(Reader):
             escapechar=writer_escapechar,
             quoting=writer_quoting,
             lineterminator=writer_lineterminator,
-            write_header=not self.resuming and write_header,
+            batch_size=writer_batch_size,
+            buffer_size=writer_buffer_size,
+            write_header=False,
             strict=False,  # NOTE: not strict because we already check row length
         )
 
+        # NOTE: the writer was given the resumer's output file and not the
+        # resumer itself, so we attach it so that the writer flushes it after
+        # each batch, and so that the resumer flushes the writer when closed
+        if self.resumer is not None:
+            self.writer.resumer = self.resumer
+            self.resumer.set_writer(self.writer)
+
+        if self.writer.should_write_header and not self.resuming and write_header:
+            self.writer.writeheader()
+
+        # NOTE: caching the bound method to avoid attribute lookups per row
+        self._writerow = self.writer._writerow
+        self._writerows = self.writer._writerows
+
     def __repr__(self):
         return "<%s>" % self.__class__.__name__
 
@@ -146,11 +183,18 @@ class Enricher(Reader):
     def should_write_header(self):
         return self.writer.should_write_header
 
+    def flush(self) -> None:
+        self.writer.flush()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
     def __filterrow(self, row):
         row = coerce_row(row)
 
-        if self.selected_indices is not None:
-            row = [row[i] for i in self.selected_indices]
+        if self.__select_cells is not None:
+            row = self.__select_cells(row)
 
         return row
 
@@ -160,7 +204,11 @@ class Enricher(Reader):
             if add is None:
                 add = self.padding
             else:
-                add = coerce_row(add, consume=True)
+                # NOTE: we only need our own copy of the addition if we are
+                # going to extend it, or if we need to measure it
+                add = coerce_row(
+                    add, consume=bool(addenda) or not isinstance(add, list)
+                )
 
                 for addition in addenda:
                     addition = coerce_row(addition)
@@ -192,7 +240,21 @@ class Enricher(Reader):
         add: Optional[AnyWritableCSVRowPart] = None,
         *addenda: AnyWritableCSVRowPart
     ) -> None:
-        self.writer._writerow(self.__formatrow(row, add, *addenda))
+        self._writerow(self.__formatrow(row, add, *addenda))
+
+    def writerows(self, items: Iterable[Tuple[AnyWritableCSVRowPart, ...]]) -> None:
+        # NOTE: items are tuples of writerow arguments, formatted and handed
+        # to the csv writer within a single writerows call
+        format_row = self.__formatrow
+
+        self._writerows(format_row(*item) for item in items)
+
+    def pipe(self, fn: Callable[[List[str]], Optional[AnyWritableCSVRowPart]]) -> None:
+        # NOTE: rows are read, formatted and handed to the csv writer within
+        # a single writerows call, instead of going through writerow each time
+        format_row = self.__formatrow
+
+        self._writerows(format_row(row, fn(row)) for row in self)
 
     def writebatch(
         self, row: AnyWritableCSVRowPart, addenda: Iterable[AnyWritableCSVRowPart]
@@ -208,7 +270,7 @@ class Enricher(Reader):
                     % (self.added_count, len(addendum))
                 )
 
-            self.writer._writerow(row + addendum)
+            self._writerow(row + addendum)
 
 
 class IndexedEnricher(Enricher):
@@ -234,6 +296,14 @@ class IndexedEnricher(Enricher):
     def records(self, *shape, with_rows=False):
         return self.enumerate_records(*shape, with_rows=with_rows)
 
+    def writerows(self, items: Iterable[Tuple[AnyWritableCSVRowPart, ...]]) -> None:
+        for item in items:
+            self.writerow(*item)
+
+    def pipe(self, fn: Callable[[List[str]], Optional[AnyWritableCSVRowPart]]) -> None:
+        for index, row in self:
+            self.writerow(index, row, fn(row))
+
     def writerow(
         self,
         index: int,
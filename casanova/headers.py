@@ -4,12 +4,12 @@
 #
 # Utility class representing a CSV file's headers
 #
-from typing import List, Union, Tuple, Optional, Iterator, Iterable
+from typing import List, Union, Tuple, Optional, Iterator, Iterable, Dict
 
 import re
 from ebbe import with_next
-from collections import namedtuple, defaultdict
-from functools import wraps
+from collections import namedtuple
+from functools import wraps, lru_cache
 
 from casanova.exceptions import (
     InvalidSelectionError,
@@ -61,6 +61,10 @@ IndexedColumn = namedtuple("IndexedColumn", ["key", "index"])
 INDEXED_HEADER_RE = re.compile(r"^.+\[(\d+)\]$")
 INDEX_REPLACER_RE = re.compile(r"\[\d+\]$")
 
+# NOTE: runs of characters having no meaning in the selection DSL are
+# matched whole, so only special characters need to be handled one by one
+SELECTION_CHUNK_RE = re.compile(r"[^\\'\",\-]+|.", re.S)
+
 
 def redirect_errors_as_invalid_selection(fn):
     @wraps(fn)
@@ -126,7 +130,7 @@ def parse_selection(string):
         current_escapechar = None
         escaping = False
 
-        for c in string:
+        for c in SELECTION_CHUNK_RE.findall(string):
             if c == "\\":
                 escaping = True
                 continue
@@ -283,6 +287,33 @@ def walk_row(node, row):
 RowKey = Union[str, int, Tuple[str, int]]
 
 
+def extend_with_complement(indices: List[int], start: int, end: int, n: int) -> None:
+    # NOTE: selected columns are always contiguous, so their complement is
+    # just the two ranges surrounding them
+    indices.extend(range(start))
+    indices.extend(range(end + 1, n))
+
+
+# NOTE: the same headers are often instantiated many times (when opening
+# multiple files sharing the same schema for instance), so we cache the
+# positions mapping. It must therefore be considered read-only.
+@lru_cache(maxsize=128)
+def build_positions_mapping(fieldnames: Tuple) -> Dict[str, Tuple[int, ...]]:
+    mapping = {}
+
+    # NOTE: positions are accumulated in lists before being frozen, so that
+    # repeated column names don't rebuild a growing tuple each time
+    for i, h in enumerate(fieldnames):
+        indices = mapping.get(h)
+
+        if indices is None:
+            mapping[h] = [i]
+        else:
+            indices.append(i)
+
+    return {h: tuple(indices) for h, indices in mapping.items()}
+
+
 class RowWrapper(object):
     __slots__ = ("__headers", "__row")
 
@@ -331,13 +362,9 @@ class Headers(object):
     def __init__(self, fieldnames: List[str]):
         self.fieldnames = list(fieldnames)
 
-        self.__mapping = defaultdict(list)
-        self.__flat_mapping = {}
+        self.__mapping = build_positions_mapping(tuple(self.fieldnames))
         self.__wrapper = RowWrapper(self, fieldnames)
-
-        for i, h in enumerate(self.fieldnames):
-            self.__mapping[h].append(i)
-            self.__flat_mapping[h] = i
+        self.__selections = {}
 
     def __eq__(self, other: "Headers") -> bool:
         return self.fieldnames == other.fieldnames
@@ -457,6 +484,14 @@ class Headers(object):
 
             return indices
 
+        # NOTE: the same selection strings tend to be resolved again and
+        # again, so we cache them. Callers get a copy they are free to mutate.
+        if isinstance(selection, str):
+            cached_indices = self.__selections.get(selection)
+
+            if cached_indices is not None:
+                return list(cached_indices)
+
         parsed_selection = (
             parse_selection(selection)
             if not isinstance(selection, Selection)
@@ -468,11 +503,7 @@ class Headers(object):
                 key = self[group.key]
 
                 if parsed_selection.inverted:
-                    for i in range(len(self)):
-                        if i == key:
-                            continue
-
-                        indices.append(i)
+                    extend_with_complement(indices, key, key, len(self))
                 else:
                     indices.append(key)
 
@@ -480,11 +511,7 @@ class Headers(object):
                 key = self[group.key, group.index]
 
                 if parsed_selection.inverted:
-                    for i in range(len(self)):
-                        if i == key:
-                            continue
-
-                        indices.append(i)
+                    extend_with_complement(indices, key, key, len(self))
                 else:
                     indices.append(key)
 
@@ -504,19 +531,20 @@ class Headers(object):
                     target_range = range(start, len(self))
 
                 if parsed_selection.inverted:
-                    for i in range(len(self)):
-                        if i in target_range:
-                            continue
-
-                        indices.append(i)
+                    extend_with_complement(
+                        indices, min(target_range), max(target_range), len(self)
+                    )
                 else:
-                    indices.extend(list(target_range))
+                    indices.extend(target_range)
 
             else:
                 raise NotImplementedError(
                     "selection implementation is erroneously not exhaustive"
                 )
 
+        if isinstance(selection, str):
+            self.__selections[selection] = tuple(indices)
+
         return indices
 
     def project(self, shape):
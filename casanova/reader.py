@@ -21,6 +21,7 @@ from casanova.headers import Headers
 from casanova.record import is_tabular_record_class
 from casanova.utils import (
     ensure_open,
+    advise_sequential_read,
     suppress_BOM,
     size_of_row_in_file,
     lines_without_null_bytes,
@@ -59,6 +60,7 @@ class Reader(object):
         multiplex: Optional[Multiplexer] = None,
         strip_null_bytes_on_read: Optional[bool] = None,
         reverse: bool = False,
+        buffer_size: Optional[int] = None,
     ):
         # Resolving global defaults
         if prebuffer_bytes is None:
@@ -72,6 +74,11 @@ class Reader(object):
 
         self.strip_null_bytes_on_read = strip_null_bytes_on_read
 
+        if buffer_size is not None and (
+            not isinstance(buffer_size, int) or buffer_size < 1
+        ):
+            raise TypeError('expecting a positive integer as "buffer_size" kwarg')
+
         if delimiter is None:
             data_format, inferred_delimiter = infer_delimiter_or_type(input_file)
 
@@ -88,7 +95,12 @@ class Reader(object):
                 input_file = request(input_file)
             else:
                 input_type = "path"
-                input_file = ensure_open(input_file, encoding=encoding)
+                input_file = ensure_open(
+                    input_file, encoding=encoding, buffer_size=buffer_size
+                )
+
+                if not reverse:
+                    advise_sequential_read(input_file)
 
         elif isinstance(input_file, Iterable):
             input_type = "iterable"
@@ -318,9 +330,12 @@ class Reader(object):
                 return row
 
     def rows(self) -> Iterator[List[str]]:
+        # NOTE: hoisting the bound method out of the loop
+        next_row = self.__next__
+
         while True:
             try:
-                yield self.__next__()
+                yield next_row()
             except StopIteration:
                 return
 
@@ -367,13 +382,9 @@ class Reader(object):
                 for row in self.rows():
                     yield row, row[pos]
 
-        else:
+            return iterator()
 
-            def iterator():
-                for row in self.rows():
-                    yield row[pos]
-
-        return iterator()
+        return (row[pos] for row in self.rows())
 
     def cells(self, column, *, with_rows=False):
         return self.__cells(column, with_rows=with_rows)
@@ -15,6 +15,7 @@ from casanova.types import (
 )
 
 import json
+from functools import partial
 from collections.abc import Mapping
 from dataclasses import fields, field, Field, is_dataclass
 
@@ -178,7 +179,8 @@ def parse(cls: Type[C], row, offset=0) -> Tuple[int, C]:
 
 
 def _cached_fields(cls):
-    fs = cls._cached_fields
+    # NOTE: reading from the class __dict__ so subclasses don't inherit the cache
+    fs = cls.__dict__.get("_cached_fields")
 
     if fs is None:
         fs = fields(cls)
@@ -187,6 +189,33 @@ def _cached_fields(cls):
     return fs
 
 
+# NOTE: field serialization options are resolved once per class, yielding
+# a list of (name, serializer) pairs, serializer being None for nested records
+def _cached_serialization_plan(cls):
+    plan = cls.__dict__.get("_cached_serialization_plan")
+
+    if plan is None:
+        plan = []
+        options = cls._serializer_options
+
+        for f in _cached_fields(cls):
+            if is_tabular_record_class(f.type):
+                plan.append((f.name, None))
+                continue
+
+            f_options = {**options, **f.metadata.get("serialization_options", {})}
+            serializer = f_options.get("serializer")
+
+            if serializer is None:
+                serializer = partial(TABULAR_RECORD_SERIALIZER, **f_options)
+
+            plan.append((f.name, serializer))
+
+        cls._cached_serialization_plan = plan
+
+    return plan
+
+
 class TabularRecord:
     _cached_fields = None
     _serializer_options = {
@@ -216,23 +245,13 @@ class TabularRecord:
     def as_csv_row(self) -> List:
         row = []
 
-        options = self._serializer_options
+        for name, serializer in _cached_serialization_plan(self.__class__):
+            v = getattr(self, name)
 
-        for f in _cached_fields(self):
-            f_options = {**options, **f.metadata.get("serialization_options", {})}
-
-            if is_tabular_record_class(f.type):
-                row.extend(getattr(self, f.name).as_csv_row())
+            if serializer is None:
+                row.extend(v.as_csv_row())
             else:
-                custom_serializer = f_options.get("serializer")
-                v = getattr(self, f.name)
-
-                if custom_serializer is not None:
-                    s = custom_serializer(v)
-                else:
-                    s = TABULAR_RECORD_SERIALIZER(v, **f_options)
-
-                row.append(s)
+                row.append(serializer(v))
 
         return row
 
@@ -242,26 +261,14 @@ class TabularRecord:
     def as_csv_dict_row(self) -> Dict[str, Any]:
         row = {}
 
-        options = self._serializer_options
+        for name, serializer in _cached_serialization_plan(self.__class__):
+            v = getattr(self, name)
 
-        for f in _cached_fields(self):
-            f_options = {**options, **f.metadata.get("serialization_options", {})}
-
-            if is_tabular_record_class(f.type):
-                data = getattr(self, f.name).as_csv_dict_row()
-
-                for n, v in data.items():
-                    row[f.name + "_" + n] = v
+            if serializer is None:
+                for n, sv in v.as_csv_dict_row().items():
+                    row[name + "_" + n] = sv
             else:
-                custom_serializer = f_options.get("serializer")
-                v = getattr(self, f.name)
-
-                if custom_serializer is not None:
-                    s = custom_serializer(v)
-                else:
-                    s = TABULAR_RECORD_SERIALIZER(v, **f_options)
-
-                row[f.name] = s
+                row[name] = serializer(v)
 
         return row
 
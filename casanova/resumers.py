@@ -23,12 +23,14 @@ from casanova.contiguous_range_set import ContiguousRangeSet
 
 
 class Resumer(object):
-    def __init__(self, path, listener=None, encoding="utf-8"):
+    def __init__(self, path, listener=None, encoding="utf-8", buffering=-1):
         self.path = path
         self.encoding = encoding
+        self.buffering = buffering
         self.output_file = None
         self.lock = Lock()
         self.popped = False
+        self.writer = None
 
         self.listener = None
 
@@ -41,11 +43,22 @@ class Resumer(object):
 
         self.listener = listener
 
+    def set_writer(self, writer):
+        self.writer = writer
+
     def can_resume(self):
         return isfile(self.path) and getsize(self.path) > 0
 
+    # NOTE: the opened file is already buffered by python so we don't need
+    # to wrap it any further. `buffering` is simply forwarded to `open`.
     def open(self, mode="a", newline=""):
-        return open(self.path, mode=mode, encoding=self.encoding, newline=newline)
+        return open(
+            self.path,
+            mode=mode,
+            encoding=self.encoding,
+            newline=newline,
+            buffering=self.buffering,
+        )
 
     def open_output_file(self, **kwargs):
         if self.output_file is not None:
@@ -95,6 +108,13 @@ class Resumer(object):
             self.output_file.flush()
 
     def close(self):
+        # NOTE: the writer attached to the resumer may hold rows in memory
+        # (batches, buffer) that must reach the output file before closing it
+        if self.writer is not None:
+            writer = self.writer
+            self.writer = None
+            writer.flush()
+
         if self.output_file is not None:
             self.output_file.close()
             self.output_file = None
@@ -100,6 +100,54 @@ class CSVSerializer(object):
             )
         )
 
+    def specialize(self) -> Callable[[Any], Any]:
+        """
+        Returns a function serializing a single value using only the
+        serializer's own settings. The most common types are dispatched
+        through a lookup on their exact type, falling back to the generic
+        path for anything else.
+        """
+        none_value = self.none_value
+
+        if not none_value and not self.stringify_everything:
+            none_value = None
+
+        true_value = self.true_value
+        false_value = self.false_value
+        plural_separator = self.plural_separator
+
+        def identity(value):
+            return value
+
+        def serialize_plural(value):
+            return plural_separator.join(str(i) for i in value)
+
+        dispatch = {
+            type(None): lambda _: none_value,
+            str: identity,
+            bool: lambda value: true_value if value else false_value,
+            int: str if self.stringify_everything else identity,
+            float: str if self.stringify_everything else identity,
+            list: serialize_plural,
+            tuple: serialize_plural,
+        }
+
+        if self.custom_types is not None:
+            dispatch.update(self.custom_types)
+
+        get = dispatch.get
+        fallback = self.__call__
+
+        def serialize(value):
+            fn = get(type(value))
+
+            if fn is None:
+                return fallback(value)
+
+            return fn(value)
+
+        return serialize
+
     def serialize_row(self, row: Iterable, **kwargs) -> List:
         return [self(value, **kwargs) for value in row]
 
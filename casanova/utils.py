@@ -6,7 +6,6 @@
 #
 from typing import Iterator, Iterable, Mapping, TypeVar, Generic, Optional, cast
 
-import re
 import csv
 import gzip
 import importlib
@@ -14,7 +13,7 @@ import os
 import sys
 from os import PathLike, SEEK_END
 from os.path import splitext, abspath, relpath, dirname
-from io import StringIO, DEFAULT_BUFFER_SIZE
+from io import StringIO, UnsupportedOperation, DEFAULT_BUFFER_SIZE
 from platform import python_version_tuple
 
 from casanova.exceptions import Py310NullByteWriteError, LtPy311ByteReadError
@@ -23,13 +22,13 @@ PY_310 = python_version_tuple()[:2] == ("3", "10")
 LT_PY311 = python_version_tuple()[:2] <= ("3", "10")
 
 
-def py310_wrap_csv_writerow(writer):
+def py310_wrap_csv_write_method(method):
     if not PY_310:
-        return writer.writerow
+        return method
 
     def wrapped(*args, **kwargs):
         try:
-            writer.writerow(*args, **kwargs)
+            method(*args, **kwargs)
         except csv.Error as e:
             if str(e).lower() == "need to escape, but no escapechar set":
                 raise Py310NullByteWriteError(
@@ -41,6 +40,14 @@ def py310_wrap_csv_writerow(writer):
     return wrapped
 
 
+def py310_wrap_csv_writerow(writer):
+    return py310_wrap_csv_write_method(writer.writerow)
+
+
+def py310_wrap_csv_writerows(writer):
+    return py310_wrap_csv_write_method(writer.writerows)
+
+
 def ltpy311_csv_reader(input_file, **kwargs):
     reader = csv.reader(input_file, **kwargs)
 
@@ -62,12 +69,14 @@ def ltpy311_csv_reader(input_file, **kwargs):
     return wrapped()
 
 
-def ensure_open(p, mode="r", encoding="utf-8", newline=None):
+def ensure_open(p, mode="r", encoding="utf-8", newline=None, buffer_size=None):
     if not isinstance(p, (str, PathLike)):
         return p
 
     p = str(p)
 
+    # NOTE: buffer_size is not relevant for gzipped files since they are
+    # decompressed by chunks anyway.
     if p.endswith(".gz"):
         if "b" in mode:
             return gzip.open(p, mode=mode, newline=newline)
@@ -75,10 +84,28 @@ def ensure_open(p, mode="r", encoding="utf-8", newline=None):
         mode += "t"
         return gzip.open(p, encoding=encoding, mode=mode, newline=newline)
 
+    buffering = buffer_size if buffer_size is not None else -1
+
     if "b" in mode:
-        return open(p, mode=mode, newline=newline)
+        return open(p, mode=mode, newline=newline, buffering=buffering)
 
-    return open(p, encoding=encoding, mode=mode, newline=newline)
+    return open(p, encoding=encoding, mode=mode, newline=newline, buffering=buffering)
+
+
+def advise_sequential_read(f) -> None:
+    """
+    Hints the kernel that the given file is going to be read sequentially
+    so it can prefetch more aggressively. This is a noop on platforms
+    lacking `posix_fadvise`.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = f.fileno()
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError, UnsupportedOperation):
+        return
 
 
 def parse_module_and_target(path, default: str = "main"):
@@ -137,11 +164,14 @@ def infer_delimiter_or_type(file_or_path):
     return ("csv", None)
 
 
-BOM_RE = re.compile(r"^\ufeff")
+BOM = "\ufeff"
 
 
 def suppress_BOM(string):
-    return re.sub(BOM_RE, "", string)
+    if string.startswith(BOM):
+        return string[1:]
+
+    return string
 
 
 def has_null_byte(string):
@@ -276,6 +306,38 @@ class CsvIO(CsvIOBase):
         self.seek(0)
 
 
+class BufferedTextWriter:
+    """
+    Thin text file-like wrapper accumulating writes in memory and forwarding
+    them to the underlying file in one call once the given amount of
+    characters has been reached. This is useful to limit the number of
+    write calls when the target is unbuffered or line-buffered.
+    """
+
+    def __init__(self, f, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.f = f
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, string: str) -> int:
+        self.parts.append(string)
+        self.size += len(string)
+
+        if self.size >= self.buffer_size:
+            self.flush()
+
+        return len(string)
+
+    def flush(self) -> None:
+        if not self.parts:
+            return
+
+        self.f.write("".join(self.parts))
+        self.parts.clear()
+        self.size = 0
+
+
 class ReversedFile:
     def __init__(self, f, offset: int = 0, buffer_size: int = DEFAULT_BUFFER_SIZE):
         self.f = f
@@ -22,7 +22,13 @@ from casanova.record import (
     infer_fieldnames,
 )
 from casanova.reader import Headers
-from casanova.utils import py310_wrap_csv_writerow, strip_null_bytes_from_row
+from casanova.utils import (
+    py310_wrap_csv_writerow,
+    py310_wrap_csv_writerows,
+    strip_null_bytes_from_row,
+    rows_without_null_bytes,
+    BufferedTextWriter,
+)
 from casanova.exceptions import InconsistentRowTypesError, InvalidRowTypeError
 
 
@@ -46,6 +52,8 @@ class Writer(object):
         lineterminator: Optional[str] = None,
         write_header: bool = True,
         strict: bool = True,
+        batch_size: Optional[int] = None,
+        buffer_size: Optional[int] = None,
     ):
         if strip_null_bytes_on_write is None:
             strip_null_bytes_on_write = DEFAULTS.strip_null_bytes_on_write
@@ -58,7 +66,8 @@ class Writer(object):
         no_headers = fieldnames is None
 
         self.fieldnames = coerce_fieldnames(fieldnames) if not no_headers else None
-        self.headers = Headers(self.fieldnames) if not no_headers else None
+        self.__headers = None
+        self.__headers_source = None
         self.no_headers = no_headers
         self.row_len = None
 
@@ -69,7 +78,23 @@ class Writer(object):
 
         self.strict = strict and self.row_len is not None
 
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size < 1
+        ):
+            raise TypeError('expecting a positive integer as "batch_size" kwarg')
+
+        self.batch_size = batch_size
+        self.__batch = []
+
+        if buffer_size is not None and (
+            not isinstance(buffer_size, int) or buffer_size < 1
+        ):
+            raise TypeError('expecting a positive integer as "buffer_size" kwarg')
+
+        self.buffer_size = buffer_size
+
         self.resuming = False
+        self.resumer = None
 
         if isinstance(output_file, Resumer):
             # NOTE: basic resumer does not need to know the headers
@@ -99,6 +124,8 @@ class Writer(object):
                 )
 
             output_file = resumer.open_output_file()
+            self.resumer = resumer
+            resumer.set_writer(self)
 
         # Instantiating writer
         self.dialect = dialect
@@ -108,43 +135,102 @@ class Writer(object):
         self.quoting = quoting
         self.lineterminator = lineterminator
 
-        writer_kwargs = {}
-
-        if dialect is not None:
-            writer_kwargs["dialect"] = dialect
-
-        if delimiter is not None:
-            writer_kwargs["delimiter"] = delimiter
-
-        if quotechar is not None:
-            writer_kwargs["quotechar"] = quotechar
-
-        if escapechar is not None:
-            writer_kwargs["escapechar"] = escapechar
+        writer_kwargs = {
+            k: v
+            for k, v in (
+                ("dialect", dialect),
+                ("delimiter", delimiter),
+                ("quotechar", quotechar),
+                ("escapechar", escapechar),
+                ("quoting", quoting),
+                ("lineterminator", lineterminator),
+            )
+            if v is not None
+        }
 
-        if quoting is not None:
-            writer_kwargs["quoting"] = quoting
+        self.__buffered_output_file = None
 
-        if lineterminator is not None:
-            writer_kwargs["lineterminator"] = lineterminator
+        if buffer_size is not None:
+            output_file = BufferedTextWriter(output_file, buffer_size=buffer_size)
+            self.__buffered_output_file = output_file
 
         self.__writer = csv.writer(output_file, **writer_kwargs)
 
         if not strip_null_bytes_on_write:
-            self._writerow = py310_wrap_csv_writerow(self.__writer)
+            self.__write = py310_wrap_csv_writerow(self.__writer)
+            self.__write_many = py310_wrap_csv_writerows(self.__writer)
         else:
-            self._writerow = lambda row: self.__writer.writerow(
-                strip_null_bytes_from_row(row)
+            csv_writerow = self.__writer.writerow
+            csv_writerows = self.__writer.writerows
+
+            self.__write = lambda row: csv_writerow(strip_null_bytes_from_row(row))
+            self.__write_many = lambda rows: csv_writerows(
+                rows_without_null_bytes(rows)
             )
 
+        if self.batch_size is None:
+            self._writerow = self.__write
+            self._writerows = self.__write_many
+        else:
+            self._writerow = self.__batch_row
+            self._writerows = self.__batch_rows
+
         self.should_write_header = not self.resuming and self.fieldnames is not None
 
         if self.should_write_header and write_header:
             self.writeheader()
 
-    def writerow(
-        self, row: AnyWritableCSVRowPart, *parts: AnyWritableCSVRowPart
-    ) -> None:
+    # NOTE: headers are built lazily since writers rarely need them and
+    # instantiating them for every writer is a waste
+    @property
+    def headers(self) -> Optional[Headers]:
+        if self.fieldnames is None:
+            return None
+
+        if self.__headers is None or self.__headers_source is not self.fieldnames:
+            self.__headers = Headers(self.fieldnames)
+            self.__headers_source = self.fieldnames
+
+        return self.__headers
+
+    # NOTE: batched rows are copied because callers are free to mutate
+    # the rows they gave us as soon as writerow returns.
+    def __batch_row(self, row) -> None:
+        self.__batch.append(list(row))
+
+        if len(self.__batch) >= self.batch_size:
+            self.flush()
+
+    def __batch_rows(self, rows) -> None:
+        for row in rows:
+            self.__batch_row(row)
+
+    def __flush_batch(self) -> None:
+        if self.__batch:
+            self.__write_many(self.__batch)
+            self.__batch.clear()
+
+    def flush(self) -> None:
+        self.__flush_batch()
+
+        if self.__buffered_output_file is not None:
+            self.__buffered_output_file.flush()
+
+        # NOTE: resumers rely on the output file to know where to resume, so
+        # we make sure what was flushed so far actually reaches it
+        if self.resumer is not None:
+            self.resumer.flush()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __formatrow(self, row, parts=()):
         has_multiple_parts = len(parts) > 0
         row = coerce_row(row, consume=has_multiple_parts)
 
@@ -157,18 +243,27 @@ class Writer(object):
                 % (self.row_len, len(row))
             )
 
-        self._writerow(row)
+        return row
+
+    def writerow(
+        self, row: AnyWritableCSVRowPart, *parts: AnyWritableCSVRowPart
+    ) -> None:
+        self._writerow(self.__formatrow(row, parts))
 
     def writerows(self, rows: Iterable[AnyWritableCSVRowPart]) -> None:
-        for row in rows:
-            self.writerow(row)
+        self._writerows(self.__formatrow(row) for row in rows)
 
     def writeheader(self) -> None:
         if self.fieldnames is None:
             raise TypeError("cannot write header if fieldnames were not provided")
 
         self.should_write_header = False
-        self._writerow(self.fieldnames)
+
+        # NOTE: the header is never batched and is flushed right away, so that
+        # it is always found in the output (resumers rely on it for instance)
+        self.__flush_batch()
+        self.__write(self.fieldnames)
+        self.flush()
 
 
 T = TypeVar("T")
@@ -260,6 +355,11 @@ class InferringWriter(Writer):
         self.__buffer_flushed = False
         self.__buffer = []
 
+        # Specialization
+        self.__specialization_attempted = False
+        self.__specialized_type = None
+        self.__specialized_serializer = None
+
         # Lifecycle
         # NOTE: we must infer even when resuming to ensure
         # row len consistency etc.
@@ -289,10 +389,61 @@ class InferringWriter(Writer):
         fieldnames = coerce_fieldnames(fieldnames)
 
         self.fieldnames = fieldnames
-        self.headers = Headers(fieldnames)
         self.row_len = len(fieldnames)
 
         self.__must_infer = False
+        self.__specialization_attempted = False
+        self.__specialized_type = None
+        self.__specialized_serializer = None
+
+    def __specialize(self, data_type) -> None:
+        serializer = self.serializer.specialize()
+
+        if data_type is dict:
+            fieldnames = self.fieldnames
+
+            def serialize(data):
+                return [serializer(data.get(k)) for k in fieldnames]
+
+        elif data_type is list or data_type is tuple:
+
+            def serialize(data):
+                return [serializer(v) for v in data]
+
+        elif callable(getattr(data_type, "__csv_row__", None)):
+
+            def serialize(data):
+                return [serializer(v) for v in data.__csv_row__()]
+
+        elif is_dataclass(data_type):
+            names = [f.name for f in fields(data_type)]
+
+            def serialize(data):
+                return [serializer(getattr(data, name)) for name in names]
+
+        # NOTE: same as above for subclasses (e.g. namedtuples, OrderedDict),
+        # checked after __csv_row__ since it takes precedence for those
+        elif issubclass(data_type, Mapping):
+            fieldnames = self.fieldnames
+
+            def serialize(data):
+                return [serializer(data.get(k)) for k in fieldnames]
+
+        elif issubclass(data_type, (list, tuple)):
+
+            def serialize(data):
+                return [serializer(v) for v in data]
+
+        elif data_type in (str, int, float, bool):
+
+            def serialize(data):
+                return [serializer(data)]
+
+        else:
+            return
+
+        self.__specialized_type = data_type
+        self.__specialized_serializer = serialize
 
     def __flush_buffer(self) -> None:
         if self.__buffer_flushed:
@@ -316,9 +467,15 @@ class InferringWriter(Writer):
             self.writeheader()
             self.__flush_buffer()
 
+        super().close()
+
     def __del__(self):
         self.close()
 
+    def writerows(self, rows: Iterable[AnyWritableCSVRowPart]) -> None:
+        for row in rows:
+            self.writerow(row)
+
     def writerow(self, *parts) -> None:
         data = None
         prepend = None
@@ -339,7 +496,13 @@ class InferringWriter(Writer):
                 data = get(parts, 1)
                 append = get(parts, 2)
 
-        if isinstance(data, (Iterator, range)):
+        # NOTE: testing exact concrete types first is way cheaper than going
+        # through the Iterator ABC's subclass hook for every row
+        data_type = type(data)
+
+        if data_type is list or data_type is tuple or data_type is dict:
+            pass
+        elif isinstance(data, (Iterator, range)):
             data = list(data)
 
         if self.__must_infer:
@@ -372,24 +535,40 @@ class InferringWriter(Writer):
 
         self.__flush_buffer()
 
-        # NOTE: coercing after inferrence not to lose fieldnames info
-        __csv_row__ = getattr(data, "__csv_row__", None)
+        # NOTE: once we know the schema, rows having the exact same type as
+        # the first one are serialized by a specialized function, skipping
+        # the whole dispatch below.
+        data_type = type(data)
 
-        if callable(__csv_row__):
-            data = __csv_row__()
+        if data_type is self.__specialized_type:
+            row = self.__specialized_serializer(data)
 
-        elif is_dataclass(data):
-            data = [getattr(data, f.name) for f in fields(data)]
+        else:
+            # NOTE: specialization is only attempted once per schema, since
+            # types we cannot specialize would otherwise be retried every row.
+            # None rows (buffered optionals) don't tell us anything though.
+            if not self.__specialization_attempted and data is not None:
+                self.__specialization_attempted = True
+                self.__specialize(data_type)
 
-        elif self.buffering_optionals and data is None:
-            data = [None] * self.row_len
+            # NOTE: coercing after inferrence not to lose fieldnames info
+            __csv_row__ = getattr(data, "__csv_row__", None)
 
-        if isinstance(data, Mapping):
-            row = [self.serializer(data.get(k)) for k in self.fieldnames]
-        elif isinstance(data, (list, tuple)):
-            row = [self.serializer(v) for v in data]
-        else:
-            row = [self.serializer(data)]
+            if callable(__csv_row__):
+                data = __csv_row__()
+
+            elif is_dataclass(data):
+                data = [getattr(data, f.name) for f in fields(data)]
+
+            elif self.buffering_optionals and data is None:
+                data = [None] * self.row_len
+
+            if isinstance(data, Mapping):
+                row = [self.serializer(data.get(k)) for k in self.fieldnames]
+            elif isinstance(data, (list, tuple)):
+                row = [self.serializer(v) for v in data]
+            else:
+                row = [self.serializer(data)]
 
         if len(row) != self.row_len:
             raise InconsistentRowTypesError
@@ -1,8 +1,8 @@
+import csv
+import pytest
 import platform
 from io import StringIO
-from contextlib import redirect_stdout
 
-from casanova import Reader
 from casanova.__main__ import run
 
 WINDOWS = "windows" in platform.system().lower()
@@ -18,16 +18,16 @@ class TestCLI(object):
             return
 
         output = StringIO()
+        run(args, output_file=output)
 
-        with redirect_stdout(output):
-            run(args)
+        value = output.getvalue()
 
         if raw:
-            assert output.getvalue().strip() == expected
+            assert value.strip() == expected
             return
 
-        output.seek(0)
-        data = list(Reader(output, no_headers=True))
+        # NOTE: keeping line endings so quoted cells containing newlines survive
+        data = list(csv.reader(value.splitlines(keepends=True)))
 
         if sort:
             data.sort(key=sort_key)
@@ -161,6 +161,10 @@ class TestCLI(object):
             [["n", "result"], ["1", ""], ["2", ""], ["3", ""]],
         )
 
+    def test_map_syntax_error(self):
+        with pytest.raises(SyntaxError):
+            run("map '1 +' result ./test/resources/count.csv", output_file=StringIO())
+
     def test_map_select(self):
         self.assert_run(
             'map "int(cell) + 5" result ./test/resources/count.csv -s n',
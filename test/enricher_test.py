@@ -7,14 +7,11 @@ import csv
 import gzip
 import casanova
 import pytest
-import time
 import sys
 from io import StringIO
 from dataclasses import dataclass
-from collections import defaultdict
-from quenouille import imap_unordered
 
-from test.utils import collect_csv
+from test.utils import collect_csv, ListenerLog
 
 from casanova.resumers import (
     LastCellComparisonResumer,
@@ -27,6 +24,12 @@ from casanova.exceptions import Py310NullByteWriteError
 from casanova.utils import PY_310, CsvIO
 
 
+def out_of_order(enricher):
+    # NOTE: emulating jobs completing out of order, using the "time" column of
+    # the fixture as completion rank
+    return sorted(enricher, key=lambda item: int(item[1][2]))
+
+
 class TestEnricher(object):
     def test_exceptions(self, tmpdir):
         output_path = str(tmpdir.join("./wrong_resumer.csv"))
@@ -36,230 +39,194 @@ class TestEnricher(object):
             with open("./test/resources/people.csv") as f, resumer:
                 casanova.enricher(f, resumer)
 
-    def test_basics(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched.csv"))
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("line",))
+    def test_basics(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("line",))
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, [i])
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "surname", "line"],
             ["John", "Matthews", "0"],
             ["Mary", "Sue", "1"],
             ["Julia", "Stone", "2"],
         ]
 
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("line", "salutation"))
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("line", "salutation"))
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, (i, "hey"))
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "surname", "line", "salutation"],
             ["John", "Matthews", "0", "hey"],
             ["Mary", "Sue", "1", "hey"],
             ["Julia", "Stone", "2", "hey"],
         ]
 
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("0", "1", "2"))
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("0", "1", "2"))
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, (j for j in range(3)))
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "surname", "0", "1", "2"],
             ["John", "Matthews", "0", "1", "2"],
             ["Mary", "Sue", "0", "1", "2"],
             ["Julia", "Stone", "0", "1", "2"],
         ]
 
-    def test_writebatch(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched.csv"))
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("number",))
+    def test_writebatch(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("number",))
 
             for row in enricher:
                 enricher.writebatch(row, [[2], [3], [6]])
                 break
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "surname", "number"],
             ["John", "Matthews", "2"],
             ["John", "Matthews", "3"],
             ["John", "Matthews", "6"],
         ]
 
-    def test_dialect(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched.csv"))
-        with open("./test/resources/semicolons.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("line",), delimiter=";")
+    def test_dialect(self):
+        buf = StringIO()
+
+        with open("./test/resources/semicolons.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("line",), delimiter=";")
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, [i])
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "surname", "line"],
             ["Rose", "Philips", "0"],
             ["Luke", "Atman", "1"],
         ]
 
-    def test_gzip(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched.csv"))
-        with gzip.open("./test/resources/people.csv.gz", "rt") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("line",))
+    def test_gzip(self):
+        buf = StringIO()
+
+        with gzip.open("./test/resources/people.csv.gz", "rt") as f:
+            enricher = casanova.enricher(f, buf, add=("line",))
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, [i])
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "surname", "line"],
             ["John", "Matthews", "0"],
             ["Mary", "Sue", "1"],
             ["Julia", "Stone", "2"],
         ]
 
-    def test_select(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched_select.csv"))
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, select=("name",), add=("line",))
+    def test_select(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, select=("name",), add=("line",))
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, [i])
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "line"],
             ["John", "0"],
             ["Mary", "1"],
             ["Julia", "2"],
         ]
 
-    def test_padding(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched_padding.csv"))
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, select=("name",), add=("line",))
+    def test_padding(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, select=("name",), add=("line",))
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row)
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["name", "line"],
             ["John", ""],
             ["Mary", ""],
             ["Julia", ""],
         ]
 
-    def test_resumable(self, tmpdir):
-        log = defaultdict(list)
-
-        def listener(name, row):
-            log[name].append(list(row))
-
-        output_path = str(tmpdir.join("./enriched_resumable.csv"))
-
-        resumer = RowCountResumer(output_path, listener=listener)
-
+    def assert_resumable(self, resumer, **kwargs):
         with open("./test/resources/people.csv") as f, resumer:
-            enricher = casanova.enricher(f, resumer, add=("x2",), select=("name",))
+            enricher = casanova.enricher(
+                f, resumer, add=("x2",), select=("name",), **kwargs
+            )
 
             row = next(iter(enricher))
             enricher.writerow(row, [2])
 
-        assert collect_csv(output_path) == [["name", "x2"], ["John", "2"]]
+        assert collect_csv(resumer.path) == [["name", "x2"], ["John", "2"]]
 
         with open("./test/resources/people.csv") as f, resumer:
-            enricher = casanova.enricher(f, resumer, add=("x2",), select=("name",))
+            enricher = casanova.enricher(
+                f, resumer, add=("x2",), select=("name",), **kwargs
+            )
 
             for i, row in enumerate(enricher):
                 enricher.writerow(row, [(i + 2) * 2])
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(resumer.path) == [
             ["name", "x2"],
             ["John", "2"],
             ["Mary", "4"],
             ["Julia", "6"],
         ]
 
+    def test_resumable(self, tmpdir):
+        log = ListenerLog()
+
+        output_path = str(tmpdir.join("./enriched_resumable.csv"))
+
+        self.assert_resumable(RowCountResumer(output_path, listener=log))
+
         assert log == {
             "output.row.read": [["John", "2"]],
             "input.row.filter": [["John", "Matthews"]],
         }
 
     def test_resumable_last_cell_comparison(self, tmpdir):
-        log = defaultdict(list)
-
-        def listener(name, row):
-            log[name].append(list(row))
+        log = ListenerLog()
 
         output_path = str(tmpdir.join("./enriched_resumable.csv"))
 
-        resumer = LastCellComparisonResumer(
-            output_path, value_column=0, listener=listener
+        self.assert_resumable(
+            LastCellComparisonResumer(output_path, value_column=0, listener=log)
         )
 
-        with open("./test/resources/people.csv") as f, resumer:
-            enricher = casanova.enricher(f, resumer, add=("x2",), select=("name",))
-
-            row = next(iter(enricher))
-            enricher.writerow(row, [2])
-
-        assert collect_csv(output_path) == [["name", "x2"], ["John", "2"]]
-
-        with open("./test/resources/people.csv") as f, resumer:
-            enricher = casanova.enricher(f, resumer, add=("x2",), select=("name",))
-
-            for i, row in enumerate(enricher):
-                enricher.writerow(row, [(i + 2) * 2])
-
-        assert collect_csv(output_path) == [
-            ["name", "x2"],
-            ["John", "2"],
-            ["Mary", "4"],
-            ["Julia", "6"],
-        ]
-
         assert log == {"input.row.filter": [["John", "Matthews"]]}
 
-    def test_indexed(self, tmpdir):
-        def job(payload):
-            i, row = payload
-            s = int(row[2])
-            time.sleep(s * 0.01)
-
-            return i, row
+    def test_indexed(self):
+        buf = StringIO()
 
-        output_path = str(tmpdir.join("./enriched_resumable_indexed.csv"))
-        with open("./test/resources/people_unordered.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.indexed_enricher(f, of, add=("x2",), select=("name",))
+        with open("./test/resources/people_unordered.csv") as f:
+            enricher = casanova.indexed_enricher(f, buf, add=("x2",), select=("name",))
 
-            for i, row in imap_unordered(enricher, job, 3):
+            for i, row in out_of_order(enricher):
                 enricher.writerow(i, row, [(i + 1) * 2])
 
         def sort_output(o):
             return sorted(tuple(i) for i in o)
 
-        assert sort_output(collect_csv(output_path)) == sort_output(
+        assert sort_output(collect_csv(buf)) == sort_output(
             [
                 ["name", "index", "x2"],
                 ["Mary", "1", "4"],
@@ -289,28 +256,18 @@ class TestEnricher(object):
         assert names == [(0, "John"), (1, "Mary"), (2, "Julia")]
 
     def test_indexed_resumable(self, tmpdir):
-        log = defaultdict(list)
-
-        def listener(name, row):
-            log[name].append(list(row))
-
-        def job(payload):
-            i, row = payload
-            s = int(row[2])
-            time.sleep(s * 0.1)
-
-            return i, row
+        log = ListenerLog()
 
         output_path = str(tmpdir.join("./enriched_resumable_indexed.csv"))
 
-        resumer = IndexedResumer(output_path, listener=listener)
+        resumer = IndexedResumer(output_path, listener=log)
 
         with open("./test/resources/people_unordered.csv") as f, resumer:
             enricher = casanova.indexed_enricher(
                 f, resumer, add=("x2",), select=("name",)
             )
 
-            for j, (i, row) in enumerate(imap_unordered(enricher, job, 3)):
+            for j, (i, row) in enumerate(out_of_order(enricher)):
                 enricher.writerow(i, row, [(i + 1) * 2])
 
                 if j == 1:
@@ -328,7 +285,7 @@ class TestEnricher(object):
                 f, resumer, add=("x2",), select=("name",)
             )
 
-            for j, (i, row) in enumerate(imap_unordered(enricher, job, 3)):
+            for j, (i, row) in enumerate(out_of_order(enricher)):
                 enricher.writerow(i, row, [(i + 1) * 2])
 
         assert sort_output(collect_csv(output_path)) == sort_output(
@@ -395,31 +352,29 @@ class TestEnricher(object):
             ["Julia", "Stone", "2"],
         ]
 
-    def test_combined_pos(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched.csv"))
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
-            enricher = casanova.enricher(f, of, add=("line",), select=("surname",))
+    def test_combined_pos(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("line",), select=("surname",))
 
             assert len(enricher.output_headers) == 2
             assert enricher.output_headers.surname == 0
             assert enricher.output_headers.line == 1
 
-    def test_batch_enricher(self, tmpdir):
-        output_path = str(tmpdir.join("./enriched.csv"))
-        with open("./test/resources/people.csv") as f, open(
-            output_path, "w", newline=""
-        ) as of:
+    def test_batch_enricher(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
             enricher = casanova.batch_enricher(
-                f, of, add=("color",), select=("surname",)
+                f, buf, add=("color",), select=("surname",)
             )
 
             for row in enricher:
                 enricher.writebatch(row, [["blue"], ["red"]], cursor="next")
                 enricher.writebatch(row, [["purple"], ["cyan"]])
 
-        assert collect_csv(output_path) == [
+        assert collect_csv(buf) == [
             ["surname", "cursor", "color"],
             ["Matthews", "", "blue"],
             ["Matthews", "next", "red"],
@@ -448,10 +403,8 @@ class TestEnricher(object):
 
         assert "\0" not in result
 
+    @pytest.mark.skipif(not PY_310, reason="null byte write issue only affects py3.10")
     def test_py310_wrapper(self):
-        if not PY_310:
-            return
-
         data = [["name"], ["John\0 Kawazaki"]]
 
         with pytest.raises(Py310NullByteWriteError):
@@ -489,31 +442,7 @@ class TestEnricher(object):
     def test_prebuffer_bytes_and_resuming(self, tmpdir):
         output_path = str(tmpdir.join("./enriched_resumable.csv"))
 
-        resumer = RowCountResumer(output_path)
-
-        with open("./test/resources/people.csv") as f, resumer:
-            enricher = casanova.enricher(
-                f, resumer, add=("x2",), select=("name",), prebuffer_bytes=1024
-            )
-            row = next(iter(enricher))
-            enricher.writerow(row, [2])
-
-        assert collect_csv(output_path) == [["name", "x2"], ["John", "2"]]
-
-        with open("./test/resources/people.csv") as f, resumer:
-            enricher = casanova.enricher(
-                f, resumer, add=("x2",), select=("name",), prebuffer_bytes=1024
-            )
-
-            for i, row in enumerate(enricher):
-                enricher.writerow(row, [(i + 2) * 2])
-
-        assert collect_csv(output_path) == [
-            ["name", "x2"],
-            ["John", "2"],
-            ["Mary", "4"],
-            ["Julia", "6"],
-        ]
+        self.assert_resumable(RowCountResumer(output_path), prebuffer_bytes=1024)
 
     def test_no_headers(self):
         with open("./test/resources/no_headers.csv") as f:
@@ -605,6 +534,68 @@ class TestEnricher(object):
 
         assert buf.getvalue().strip() == "name,count1,count2\nJohn,0,1"
 
+    def test_writerows(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("line",), select=("surname",))
+            enricher.writerows((row, [i]) for i, row in enumerate(enricher))
+
+        assert collect_csv(buf) == [
+            ["surname", "line"],
+            ["Matthews", "0"],
+            ["Sue", "1"],
+            ["Stone", "2"],
+        ]
+
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.indexed_enricher(f, buf, add=("line",))
+            enricher.writerows((i, row, [i * 2]) for i, row in enricher)
+
+        assert collect_csv(buf) == [
+            ["name", "surname", "index", "line"],
+            ["John", "Matthews", "0", "0"],
+            ["Mary", "Sue", "1", "2"],
+            ["Julia", "Stone", "2", "4"],
+        ]
+
+        with pytest.raises(TypeError):
+            enricher = casanova.enricher(StringIO("name\njohn"), StringIO())
+            enricher.writerows((row, [1]) for row in enricher)
+
+    def test_pipe(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.enricher(f, buf, add=("length",), select=("name",))
+            enricher.pipe(lambda row: [len(row[1])])
+
+        assert collect_csv(buf) == [
+            ["name", "length"],
+            ["John", "8"],
+            ["Mary", "3"],
+            ["Julia", "5"],
+        ]
+
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            enricher = casanova.indexed_enricher(f, buf, add=("length",))
+            enricher.pipe(lambda row: [len(row[1])])
+
+        assert collect_csv(buf) == [
+            ["name", "surname", "index", "length"],
+            ["John", "Matthews", "0", "8"],
+            ["Mary", "Sue", "1", "3"],
+            ["Julia", "Stone", "2", "5"],
+        ]
+
+        with pytest.raises(TypeError):
+            enricher = casanova.enricher(StringIO("name\njohn"), StringIO())
+            enricher.pipe(lambda row: [1])
+
     def test_backwards_compatibility_writerow(self):
         # without add
         buf = StringIO()
@@ -671,3 +662,102 @@ class TestEnricher(object):
 
         assert enricher.fieldnames == ["name", "surname"]
         assert enricher.output_fieldnames == ["name", "age"]
+
+    def test_writer_batch_size(self):
+        with pytest.raises(TypeError, match="batch_size"):
+            casanova.enricher(StringIO("name\njohn"), StringIO(), writer_batch_size=0)
+
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            with casanova.enricher(
+                f, buf, add=("line",), writer_batch_size=2, writer_lineterminator="\n"
+            ) as enricher:
+                for i, row in enumerate(enricher):
+                    enricher.writerow(row, [i])
+
+                assert buf.getvalue().strip() == (
+                    "name,surname,line\nJohn,Matthews,0\nMary,Sue,1"
+                )
+
+        assert collect_csv(buf) == [
+            ["name", "surname", "line"],
+            ["John", "Matthews", "0"],
+            ["Mary", "Sue", "1"],
+            ["Julia", "Stone", "2"],
+        ]
+
+    def test_writer_batch_size_resumer(self, tmpdir):
+        output_path = str(tmpdir.join("./enriched_batched_resumable.csv"))
+
+        header = ["name", "surname", "line"]
+        rows = [
+            ["John", "Matthews", "0"],
+            ["Mary", "Sue", "1"],
+            ["Julia", "Stone", "2"],
+        ]
+
+        with open("./test/resources/people.csv") as f:
+            resumer = RowCountResumer(output_path)
+            enricher = casanova.enricher(f, resumer, add=("line",), writer_batch_size=2)
+
+            assert collect_csv(output_path) == [header]
+
+            for i, row in enumerate(enricher):
+                enricher.writerow(row, [i])
+
+            assert collect_csv(output_path) == [header] + rows[:2]
+
+            # NOTE: simulating an aborted run, the pending batch being lost
+            resumer.output_file.close()
+
+        with open("./test/resources/people.csv") as f, RowCountResumer(
+            output_path
+        ) as resumer:
+            enricher = casanova.enricher(f, resumer, add=("line",), writer_batch_size=2)
+
+            assert resumer.already_done_count() == 2
+
+            for i, row in enumerate(enricher, start=2):
+                enricher.writerow(row, [i])
+
+        assert collect_csv(output_path) == [header] + rows
+
+    def test_reused_addition(self):
+        for batch_size in (None, 2):
+            buf = StringIO()
+
+            with casanova.enricher(
+                CsvIO([["John"], ["Mary"]], ["name"]),
+                buf,
+                add=("index",),
+                writer_batch_size=batch_size,
+                writer_lineterminator="\n",
+            ) as enricher:
+                addition = [None]
+
+                for i, row in enumerate(enricher):
+                    addition[0] = i
+                    enricher.writerow(row, addition)
+
+            assert addition == [1]
+            assert buf.getvalue().strip() == "name,index\nJohn,0\nMary,1"
+
+    def test_writer_buffer_size(self):
+        buf = StringIO()
+
+        with open("./test/resources/people.csv") as f:
+            with casanova.enricher(
+                f, buf, add=("line",), writer_buffer_size=1024
+            ) as enricher:
+                for i, row in enumerate(enricher):
+                    enricher.writerow(row, [i])
+
+                assert collect_csv(buf) == [["name", "surname", "line"]]
+
+        assert collect_csv(buf) == [
+            ["name", "surname", "line"],
+            ["John", "Matthews", "0"],
+            ["Mary", "Sue", "1"],
+            ["Julia", "Stone", "2"],
+        ]
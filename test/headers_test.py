@@ -41,6 +41,21 @@ class TestHeaders(object):
         assert headers.get("Foo", index=2) == 3
         assert headers["Foo", 2] == 3
 
+    def test_shared_schema(self):
+        fieldnames = ["Foo", "Bar", "Foo"]
+
+        first = Headers(fieldnames)
+        second = Headers(fieldnames)
+
+        first.fieldnames.append("Baz")
+
+        assert second.fieldnames == ["Foo", "Bar", "Foo"]
+        assert second["Foo", 1] == 2
+        assert "Baz" not in second
+
+        with pytest.raises(NthNamedColumnOutOfRangeError):
+            second["Foo", 2]
+
     def test_selection_dsl(self):
         headers = Headers(
             [
@@ -103,6 +118,10 @@ class TestHeaders(object):
         assert headers.select("2-6") == [1, 2, 3, 4, 5]
         assert indices == [0, 6, 7, 8, 9, 10]
 
+        assert headers.select("!6-2") == [0, 6, 7, 8, 9, 10]
+        assert headers.select("!9-") == [0, 1, 2, 3, 4, 5, 6, 7]
+        assert headers.select("!1-11") == []
+
         selection = list(parse_selection('\\"Hey\\"'))
 
         assert selection == [SingleColumn(key='"Hey"')]
@@ -122,6 +141,24 @@ class TestHeaders(object):
 
         assert Headers.select_no_headers(5, "1-4") == [0, 1, 2, 3]
 
+    def test_selection_cache(self):
+        headers = Headers(["Foo", "Bar", "Baz"])
+
+        indices = headers.select("Foo,Baz")
+        assert indices == [0, 2]
+
+        indices.append(1)
+
+        assert headers.select("Foo,Baz") == [0, 2]
+        assert headers.select("!Bar") == [0, 2]
+        assert headers.select("Bar-") == [1, 2]
+
+        with pytest.raises(InvalidSelectionError):
+            headers.select("Qux")
+
+        with pytest.raises(InvalidSelectionError):
+            headers.select("Qux")
+
     def test_projection(self):
         headers = Headers(["name", "surname", "age", "height"])
         row = ["John", "Williams", "45", "190"]
@@ -3,6 +3,7 @@
 # =============================================================================
 import pytest
 from io import StringIO
+from collections import namedtuple
 from dataclasses import dataclass
 
 from test.utils import collect_csv
@@ -38,6 +39,98 @@ class TestInferringWriter(object):
 
         assert collect_csv(output) == [["one"], ["1"], ["none"]]
 
+    def test_mixed_row_types(self):
+        output = StringIO()
+        writer = InferringWriter(output)
+
+        writer.writerow({"one": 1, "two": 2})
+        writer.writerow([3, 4])
+        writer.writerow({"two": 6, "one": 5})
+        writer.writerow((7, 8))
+
+        assert collect_csv(output) == [
+            ["one", "two"],
+            ["1", "2"],
+            ["3", "4"],
+            ["5", "6"],
+            ["7", "8"],
+        ]
+
+    def test_specialized_row_types(self):
+        @dataclass
+        class Video(TabularRecord):
+            title: str
+            duration: int
+
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        output = StringIO()
+        writer = InferringWriter(output)
+        writer.writerow(Video("one", 14))
+        writer.writerow(Video("two", 67))
+        writer.writerow(["three", 3])
+
+        assert collect_csv(output) == [
+            ["title", "duration"],
+            ["one", "14"],
+            ["two", "67"],
+            ["three", "3"],
+        ]
+
+        output = StringIO()
+        writer = InferringWriter(output)
+        writer.writerow(Point(1, 2))
+        writer.writerow(Point(3, 4))
+
+        assert collect_csv(output) == [["x", "y"], ["1", "2"], ["3", "4"]]
+
+        output = StringIO()
+        writer = InferringWriter(output, true_value="yes")
+        writer.writerow("one")
+        writer.writerow("two")
+        writer.writerow(True)
+
+        assert collect_csv(output) == [["value"], ["one"], ["two"], ["yes"]]
+
+    def test_specialization_attempts(self):
+        Point = namedtuple("Point", ["x", "y"])
+
+        output = StringIO()
+        writer = InferringWriter(output)
+
+        specialize = writer.serializer.specialize
+        calls = []
+
+        def counting_specialize():
+            calls.append(True)
+            return specialize()
+
+        writer.serializer.specialize = counting_specialize
+
+        for i in range(10):
+            writer.writerow(Point(i, i * 2))
+
+        assert len(calls) == 1
+        assert collect_csv(output)[:3] == [["col1", "col2"], ["0", "0"], ["1", "2"]]
+
+        calls.clear()
+
+        output = StringIO()
+        writer = InferringWriter(output)
+        writer.serializer.specialize = counting_specialize
+
+        class Name(str):
+            pass
+
+        for i in range(10):
+            writer.writerow(Name("name%i" % i))
+
+        assert len(calls) == 1
+        assert collect_csv(output)[:3] == [["value"], ["name0"], ["name1"]]
+
     def test_basics(self):
         self.assert_writerow("john", [["value"], ["john"]])
         self.assert_writerow(34, [["value"], ["34"]])
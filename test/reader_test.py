@@ -5,6 +5,7 @@ import gzip
 import casanova
 import pytest
 from io import StringIO
+from types import GeneratorType
 from dataclasses import dataclass
 
 from casanova.defaults import set_defaults
@@ -101,7 +102,11 @@ class TestReader(object):
             with pytest.raises(MissingColumnError):
                 reader.cells("whatever")
 
-            names = [name for name in reader.cells("name")]
+            cells = reader.cells("name")
+
+            assert isinstance(cells, GeneratorType)
+
+            names = [name for name in cells]
 
             assert names == ["John", "Mary", "Julia"]
 
@@ -222,6 +227,15 @@ class TestReader(object):
 
         reader.close()
 
+    def test_buffer_size(self):
+        with pytest.raises(TypeError):
+            casanova.reader("./test/resources/people.csv", buffer_size=0)
+
+        with casanova.reader(
+            "./test/resources/people.csv", buffer_size=1 << 20
+        ) as reader:
+            assert list(reader.cells("name")) == ["John", "Mary", "Julia"]
+
     def test_context(self):
         with casanova.reader("./test/resources/people.csv") as reader:
             assert list(reader.cells("name")) == ["John", "Mary", "Julia"]
@@ -135,6 +135,31 @@ class TestTabularRecord(object):
 
         assert video.as_csv_row() == ["Test", "KeyError('k') Success"]
 
+    def test_subclass(self):
+        @dataclass
+        class Video(TabularRecord):
+            title: str
+            duration: int
+
+        @dataclass
+        class DetailedVideo(Video):
+            author: str
+
+        assert Video.fieldnames() == ["title", "duration"]
+        assert DetailedVideo.fieldnames() == ["title", "duration", "author"]
+
+        assert Video("one", 14).as_csv_row() == ["one", "14"]
+        assert DetailedVideo("two", 67, "john").as_csv_row() == ["two", "67", "john"]
+        assert DetailedVideo("two", 67, "john").as_csv_dict_row() == {
+            "title": "two",
+            "duration": "67",
+            "author": "john",
+        }
+
+        assert DetailedVideo.parse(["two", "67", "john"]) == DetailedVideo(
+            "two", 67, "john"
+        )
+
     def test_custom_json_encoder(self):
         @dataclass
         class Video(TabularRecord):
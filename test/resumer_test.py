@@ -17,3 +17,17 @@ class TestResumer(object):
             _ = casanova.enricher(f, resumer)
 
         assert resumer.already_done_count() == 6
+
+    def test_buffering(self, tmpdir):
+        output_path = str(tmpdir.join("./buffered_resumable.csv"))
+
+        with RowCountResumer(output_path, buffering=1 << 16) as resumer:
+            enricher = casanova.enricher("./test/resources/people.csv", resumer)
+
+            for row in enricher:
+                enricher.writerow(row)
+
+        with RowCountResumer(output_path, buffering=1 << 16) as resumer:
+            assert resumer.can_resume()
+            casanova.enricher("./test/resources/people.csv", resumer)
+            assert resumer.already_done_count() == 3
@@ -58,3 +58,36 @@ class TestSerialization(object):
             serializer(KeyError("test"), custom_types={KeyError: lambda v: "45"})
             == "45"
         )
+
+    def test_specialize(self):
+        serializer = CSVSerializer(
+            plural_separator="#",
+            true_value="yes",
+            custom_types={KeyError: lambda v: "key: %s" % v},
+        )
+        serialize = serializer.specialize()
+
+        values = [
+            "test",
+            None,
+            True,
+            False,
+            45,
+            7.4,
+            ["blue", "yellow"],
+            ("a", "b"),
+            {"a", "b"},
+            date(2022, 1, 2),
+            KeyError("test"),
+        ]
+
+        for value in values:
+            assert serialize(value) == serializer(value)
+
+        serialize = CSVSerializer(stringify_everything=False).specialize()
+
+        assert serialize(None) is None
+        assert serialize(45) == 45
+
+        with raises(NotImplementedError):
+            serialize({"hello": 45})
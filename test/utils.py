@@ -8,3 +8,15 @@ def collect_csv(buf):
 
     with open(buf) as f:
         return list(csv.reader(f))
+
+
+# NOTE: resumer listener recording received rows, grouped by event name
+class ListenerLog(dict):
+    def __call__(self, name, row):
+        rows = self.get(name)
+
+        if rows is None:
+            rows = []
+            self[name] = rows
+
+        rows.append(list(row))
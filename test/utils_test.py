@@ -13,6 +13,9 @@ from casanova.utils import (
     CsvIO,
     PeekableIterator,
     ReversedFile,
+    BufferedTextWriter,
+    advise_sequential_read,
+    suppress_BOM,
 )
 
 
@@ -168,3 +171,29 @@ class TestUtils(object):
         r = ReversedFile(StringIO("a\n\nb\nc\n"), buffer_size=2)
 
         assert list(r) == ["c\n", "b\n", "\n", "a"]
+
+    def test_buffered_text_writer(self):
+        output = StringIO()
+        writer = BufferedTextWriter(output, buffer_size=5)
+
+        writer.write("abc")
+        assert output.getvalue() == ""
+
+        writer.write("de")
+        assert output.getvalue() == "abcde"
+
+        writer.write("f")
+        writer.flush()
+        assert output.getvalue() == "abcdef"
+
+    def test_advise_sequential_read(self):
+        advise_sequential_read(StringIO("test"))
+
+        with open("./test/resources/people.csv") as f:
+            advise_sequential_read(f)
+            assert f.readline() == "name,surname\n"
+
+    def test_suppress_bom(self):
+        assert suppress_BOM("\ufeffname") == "name"
+        assert suppress_BOM("name\ufeff") == "name\ufeff"
+        assert suppress_BOM("") == ""
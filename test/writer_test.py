@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from test.utils import collect_csv
 
 from casanova.utils import PY_310
+from casanova.headers import Headers
 from casanova.writer import Writer
 from casanova.resumers import BasicResumer, LastCellResumer
 from casanova.exceptions import Py310NullByteWriteError
@@ -134,10 +135,8 @@ class TestWriter(object):
 
         assert output.getvalue().strip() == "John"
 
+    @pytest.mark.skipif(not PY_310, reason="null byte write issue only affects py3.10")
     def test_py310_wrapper(self):
-        if not PY_310:
-            return
-
         with pytest.raises(Py310NullByteWriteError):
             writer = Writer(StringIO(), fieldnames=["name"])
             writer.writerow(["John\0 Kawazaki"])
@@ -235,3 +234,115 @@ class TestWriter(object):
 
         with pytest.raises(TypeError, match="expect"):
             writer.writerow(["one", "two", "three"])
+
+    def test_headers(self):
+        writer = Writer(StringIO(), fieldnames=["name", "surname"])
+
+        assert writer.headers == Headers(["name", "surname"])
+        assert writer.headers is writer.headers
+
+        writer = Writer(StringIO())
+
+        assert writer.headers is None
+
+    def test_batch_size(self):
+        with pytest.raises(TypeError):
+            Writer(StringIO(), batch_size=0)
+
+        output = StringIO()
+        writer = Writer(output, fieldnames=["n"], batch_size=2)
+
+        assert collect_csv(output) == [["n"]]
+
+        row = ["0"]
+        writer.writerow(row)
+        row[0] = "mutated"
+
+        assert collect_csv(output) == [["n"]]
+
+        writer.writerows([[1], [2], [3]])
+
+        assert collect_csv(output) == [["n"], ["0"], ["1"], ["2"], ["3"]]
+
+        writer.writerow([4])
+
+        assert collect_csv(output) == [["n"], ["0"], ["1"], ["2"], ["3"]]
+
+        writer.flush()
+
+        assert collect_csv(output) == [["n"], ["0"], ["1"], ["2"], ["3"], ["4"]]
+
+        output = StringIO()
+
+        with Writer(output, fieldnames=["n"], batch_size=10) as writer:
+            writer.writerows(range(i, i + 1) for i in range(4))
+
+        assert collect_csv(output) == [["n"], ["0"], ["1"], ["2"], ["3"]]
+
+    def test_buffer_size(self):
+        with pytest.raises(TypeError):
+            Writer(StringIO(), buffer_size=-4)
+
+        output = StringIO()
+        writer = Writer(output, fieldnames=["n"], buffer_size=8, lineterminator="\n")
+
+        assert output.getvalue() == "n\n"
+
+        writer.writerow(["one"])
+
+        assert output.getvalue() == "n\n"
+
+        writer.writerow(["two"])
+
+        assert output.getvalue() == "n\none\ntwo\n"
+
+        writer.writerow(["three"])
+        writer.close()
+
+        assert output.getvalue() == "n\none\ntwo\nthree\n"
+
+    def test_buffer_size_resumer(self, tmpdir):
+        output_path = str(tmpdir.join("./written_buffered_resumable.csv"))
+
+        with LastCellResumer(output_path, value_column="index") as resumer:
+            writer = Writer(resumer, ["index"], buffer_size=1024)
+
+            for i in range(3):
+                writer.writerow([i])
+
+            assert collect_csv(output_path) == [["index"]]
+
+        assert collect_csv(output_path) == [["index"], ["0"], ["1"], ["2"]]
+
+    def test_batch_size_resumer(self, tmpdir):
+        output_path = str(tmpdir.join("./written_batched_resumable.csv"))
+
+        resumer = LastCellResumer(output_path, value_column="index")
+        writer = Writer(resumer, ["index"], batch_size=2)
+
+        assert collect_csv(output_path) == [["index"]]
+
+        writer.writerow([0])
+
+        assert collect_csv(output_path) == [["index"]]
+
+        writer.writerow([1])
+
+        assert collect_csv(output_path) == [["index"], ["0"], ["1"]]
+
+        writer.writerow([2])
+
+        # NOTE: simulating an aborted run, the pending batch being lost
+        resumer.output_file.close()
+
+        assert collect_csv(output_path) == [["index"], ["0"], ["1"]]
+
+        with LastCellResumer(output_path, value_column="index") as resumer:
+            writer = Writer(resumer, ["index"], batch_size=2)
+
+            assert resumer.get_state() == "1"
+
+            for i in range(2, 5):
+                writer.writerow([i])
+
+        assert collect_csv(output_path) == [["index"]] + [[str(i)] for i in range(5)]